@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+BusWay Pro - White-label Asset Render Service
+Local HTTP service that renders the app icon and feature graphic with a
+school's name and colours, returning encoded PNG/WebP bytes.
+
+    python asset_render_service.py --port 8765 --disk-cache .render-cache
+    GET /render/icon?name=Springdale&primary=0f766e&accent=facc15&format=webp
+    GET /render/feature-graphic?title=Spring&title_highlight=dale&tagline=...
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlparse
+
+from generate_app_icon import create_app_icon
+from generate_feature_graphic_v2 import create_feature_graphic
+from generate_play_store_assets import hex_to_rgb
+
+# Asset name -> (render function, text params, colour params)
+ASSETS = {
+    "icon": (create_app_icon, ("name", "highlight"), ("primary", "primary_dark", "accent")),
+    "feature-graphic": (
+        create_feature_graphic,
+        ("title", "title_highlight", "tagline", "subtitle"),
+        ("primary", "primary_dark", "background", "accent"),
+    ),
+}
+
+FORMATS = {"png": ("PNG", "image/png"), "webp": ("WEBP", "image/webp")}
+MAX_TEXT_LENGTH = 80
+
+# Bump whenever create_app_icon() or create_feature_graphic() output changes;
+# it is part of every cache key, so stale disk entries and client caches are skipped
+RENDER_VERSION = 3
+
+
+def parse_params(asset, query):
+    """
+    Validate query parameters for an asset.
+    Returns (params, format); raises ValueError with a client-facing message.
+    """
+    if asset not in ASSETS:
+        raise ValueError(f"Unknown asset '{asset}'")
+    _, text_keys, colour_keys = ASSETS[asset]
+
+    params = {}
+    fmt = "png"
+    for key, value in query:
+        if key == "format":
+            fmt = value.lower()
+            if fmt not in FORMATS:
+                raise ValueError(f"Unsupported format '{value}'")
+        elif key in text_keys:
+            # An empty value is passed through, e.g. highlight= for no highlight
+            if len(value) > MAX_TEXT_LENGTH:
+                raise ValueError(f"'{key}' is longer than {MAX_TEXT_LENGTH} characters")
+            params[key] = value
+        elif key in colour_keys:
+            value = value.lstrip('#')
+            if len(value) != 6 or any(c not in "0123456789abcdefABCDEF" for c in value):
+                raise ValueError(f"'{key}' must be a hex colour like 1e40af")
+            params[key] = hex_to_rgb(value)
+        else:
+            raise ValueError(f"Unknown parameter '{key}' for {asset}")
+    return params, fmt
+
+
+def cache_key(asset, params, fmt):
+    """Stable hash of a render request"""
+    payload = json.dumps({"version": RENDER_VERSION, "asset": asset, "format": fmt, "params": params},
+                         sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def render_asset(asset, params, fmt):
+    """Render and encode one asset; runs inside a worker process"""
+    render, _, _ = ASSETS[asset]
+    image = render(**params)
+    pil_format, _ = FORMATS[fmt]
+    if pil_format == "WEBP":
+        options = {"lossless": True, "method": 4}
+    else:
+        options = {"optimize": True}
+    buffer = io.BytesIO()
+    image.save(buffer, pil_format, **options)
+    return buffer.getvalue()
+
+
+class ByteLRUCache:
+    """
+    Thread-safe LRU cache of encoded bytes bounded by total size, with an
+    optional directory used as a second tier that survives restarts.
+    """
+
+    def __init__(self, max_bytes, disk_dir=None):
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.size = 0
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    def _disk_path(self, key):
+        return os.path.join(self.disk_dir, key)
+
+    def get(self, key):
+        with self.lock:
+            data = self.entries.get(key)
+            if data is not None:
+                self.entries.move_to_end(key)
+                return data
+        if self.disk_dir:
+            try:
+                with open(self._disk_path(key), "rb") as fh:
+                    data = fh.read()
+            except FileNotFoundError:
+                return None
+            self._insert(key, data)
+            return data
+        return None
+
+    def put(self, key, data):
+        self._insert(key, data)
+        if self.disk_dir:
+            # Write then rename so readers never see a partial file
+            tmp_path = f"{self._disk_path(key)}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as fh:
+                fh.write(data)
+            os.replace(tmp_path, self._disk_path(key))
+
+    def _insert(self, key, data):
+        if len(data) > self.max_bytes:
+            return
+        with self.lock:
+            old = self.entries.pop(key, None)
+            if old is not None:
+                self.size -= len(old)
+            self.entries[key] = data
+            self.size += len(data)
+            while self.size > self.max_bytes:
+                _, evicted = self.entries.popitem(last=False)
+                self.size -= len(evicted)
+
+
+class RenderService:
+    """Renders assets on a process pool, caching results and collapsing duplicate requests"""
+
+    def __init__(self, workers=None, cache_bytes=64 * 1024 * 1024, disk_dir=None):
+        self.workers = workers
+        self.executor = self._new_executor()
+        self.cache = ByteLRUCache(cache_bytes, disk_dir)
+        self.inflight = {}
+        self.lock = threading.Lock()
+
+    def _new_executor(self):
+        # Fresh interpreters rather than fork(): forking a threaded server can
+        # copy a lock held by another thread into the worker
+        method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        return ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context(method))
+
+    def get(self, asset, params, fmt):
+        """Return (key, encoded bytes) for a request, rendering at most once per key"""
+        key = cache_key(asset, params, fmt)
+        data = self.cache.get(key)
+        if data is not None:
+            return key, data
+
+        try:
+            return key, self._render(key, asset, params, fmt)
+        except BrokenProcessPool:
+            # A worker died (OOM kill, crash); replace the pool and retry once
+            return key, self._render(key, asset, params, fmt)
+
+    def _render(self, key, asset, params, fmt):
+        """Wait for the in-flight render of `key`, submitting it if there is none"""
+        submitted = False
+        with self.lock:
+            entry = self.inflight.get(key)
+            if entry is None:
+                # Re-check under the lock: a render may have finished meanwhile
+                data = self.cache.get(key)
+                if data is not None:
+                    return data
+                executor = self.executor
+                try:
+                    future = executor.submit(render_asset, asset, params, fmt)
+                except BrokenProcessPool:
+                    self._replace_executor(executor)
+                    executor = self.executor
+                    future = executor.submit(render_asset, asset, params, fmt)
+                entry = self.inflight[key] = (future, executor)
+                submitted = True
+        future, executor = entry
+        # Registered outside the lock: a future that is already done runs the
+        # callback immediately in this thread, and _finish takes the lock
+        if submitted:
+            future.add_done_callback(lambda f, key=key: self._finish(key, f))
+        try:
+            return future.result()
+        except BrokenProcessPool:
+            with self.lock:
+                self._replace_executor(executor)
+                if self.inflight.get(key) is entry:
+                    del self.inflight[key]
+            raise
+
+    def _replace_executor(self, broken):
+        """Swap in a new pool if `broken` is still current; caller holds self.lock"""
+        if self.executor is broken:
+            broken.shutdown(wait=False)
+            self.executor = self._new_executor()
+
+    def _finish(self, key, future):
+        # Store before dropping the in-flight entry so no request misses both
+        if future.exception() is None:
+            self.cache.put(key, future.result())
+        with self.lock:
+            entry = self.inflight.get(key)
+            if entry is not None and entry[0] is future:
+                del self.inflight[key]
+
+    def shutdown(self):
+        self.executor.shutdown(wait=True)
+
+
+class RenderHandler(BaseHTTPRequestHandler):
+    """GET /render/<asset>?<params> and GET /health"""
+
+    service = None
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == "/health":
+            self._send(200, "text/plain", b"ok")
+            return
+
+        parts = url.path.strip("/").split("/")
+        if len(parts) != 2 or parts[0] != "render":
+            self._send(404, "text/plain", b"Not found")
+            return
+
+        try:
+            params, fmt = parse_params(parts[1], parse_qsl(url.query, keep_blank_values=True))
+        except ValueError as e:
+            self._send(400, "text/plain", str(e).encode("utf-8"))
+            return
+
+        # The ETag is the cache key, so a conditional GET is answered without rendering
+        etag = f'"{cache_key(parts[1], params, fmt)}"'
+        if self.headers.get("If-None-Match") == etag:
+            self._send(304, None, b"", etag)
+            return
+
+        try:
+            _, data = self.service.get(parts[1], params, fmt)
+        except Exception as e:
+            self._send(500, "text/plain", f"Render failed: {e}".encode("utf-8"))
+            return
+        self._send(200, FORMATS[fmt][1], data, etag)
+
+    def _send(self, status, content_type, body, etag=None):
+        self.send_response(status)
+        if content_type:
+            self.send_header("Content-Type", content_type)
+        if etag:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "public, max-age=31536000, immutable")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def main():
+    """Run the render service until interrupted"""
+    parser = argparse.ArgumentParser(description="White-label asset render service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=None, help="render processes (default: CPU count)")
+    parser.add_argument("--cache-mb", type=int, default=64, help="in-memory cache size in MB")
+    parser.add_argument("--disk-cache", default=None, help="directory for the on-disk cache tier")
+    args = parser.parse_args()
+
+    service = RenderService(args.workers, args.cache_mb * 1024 * 1024, args.disk_cache)
+    RenderHandler.service = service
+    server = ThreadingHTTPServer((args.host, args.port), RenderHandler)
+    print(f"✓ Render service listening on http://{args.host}:{args.port}/render/<icon|feature-graphic>")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nShutting down...")
+    finally:
+        server.server_close()
+        service.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -4,119 +4,153 @@ Generate WayPro Pro App Icon
 Creates: 512×512 px PNG icon for Google Play Store
 """
 
-from PIL import Image, ImageDraw, ImageFont
+import os
+
+from PIL import Image, ImageDraw
+
+from generate_play_store_assets import fit_font_size, load_font
+from stamping import Stamp
 
-# Create image with rounded background
 SIZE = 512
-image = Image.new('RGB', (SIZE, SIZE), color=(30, 64, 175))  # #1e40af - WayPro blue
-draw = ImageDraw.Draw(image)
-
-# Create gradient background
-for y in range(SIZE):
-    ratio = y / SIZE
-    r = int(30 + (15 - 30) * ratio)
-    g = int(64 + (40 - 64) * ratio)
-    b = int(175 + (138 - 175) * ratio)
-    draw.line([(0, y), (SIZE, y)], fill=(r, g, b))
-
-# Draw rounded corners (create mask for rounded corners)
-corners = Image.new('L', (SIZE, SIZE), 0)
-corners_draw = ImageDraw.Draw(corners)
-corners_draw.ellipse([0, 0, SIZE-1, SIZE-1], fill=255)
-image.putalpha(corners)
-
-# ============ SCHOOL BUS ICON (CENTER) ============
-
-bus_x, bus_y = 100, 180
-bus_width, bus_height = 312, 160
-
-# Bus body - main background
-draw.rectangle([bus_x, bus_y, bus_x + bus_width, bus_y + bus_height], 
-               fill=(251, 191, 36), outline=(15, 23, 42), width=3)
-
-# Bus roof
-roof_points = [
-    (bus_x, bus_y),
-    (bus_x + 60, bus_y - 80),
-    (bus_x + bus_width - 60, bus_y - 80),
-    (bus_x + bus_width, bus_y)
-]
-draw.polygon(roof_points, fill=(251, 191, 36), outline=(15, 23, 42))
-
-# Front windshield
-draw.ellipse([bus_x + 20, bus_y - 60, bus_x + 100, bus_y - 10], 
-             fill=(174, 229, 255), outline=(14, 165, 233), width=2)
-
-# Side windows (5 windows)
-for i in range(5):
-    x = bus_x + 120 + (i * 45)
-    draw.rounded_rectangle([x, bus_y - 50, x + 32, bus_y - 20], 
-                          radius=3, fill=(174, 229, 255), outline=(14, 165, 233), width=1)
-
-# Lower windows (4)
-for i in range(4):
-    x = bus_x + 40 + (i * 75)
-    draw.rounded_rectangle([x, bus_y + 80, x + 55, bus_y + 140], 
-                          radius=3, fill=(174, 229, 255), outline=(14, 165, 233), width=1)
-
-# Wheels
-wheel_y = bus_y + bus_height + 20
-# Front wheel
-draw.ellipse([bus_x + 40 - 40, wheel_y - 40, bus_x + 40 + 40, wheel_y + 40], 
-             fill=(15, 23, 42), outline=(75, 85, 99), width=2)
-draw.ellipse([bus_x + 40 - 28, wheel_y - 28, bus_x + 40 + 28, wheel_y + 28], 
-             fill=(75, 85, 99))
-draw.ellipse([bus_x + 40 - 16, wheel_y - 16, bus_x + 40 + 16, wheel_y + 16], 
-             fill=(55, 65, 81))
-
-# Rear wheel
-draw.ellipse([bus_x + bus_width - 40 - 40, wheel_y - 40, bus_x + bus_width - 40 + 40, wheel_y + 40], 
-             fill=(15, 23, 42), outline=(75, 85, 99), width=2)
-draw.ellipse([bus_x + bus_width - 40 - 28, wheel_y - 28, bus_x + bus_width - 40 + 28, wheel_y + 28], 
-             fill=(75, 85, 99))
-draw.ellipse([bus_x + bus_width - 40 - 16, wheel_y - 16, bus_x + bus_width - 40 + 16, wheel_y + 16], 
-             fill=(55, 65, 81))
-
-# Headlights
-draw.ellipse([bus_x + 15, bus_y + 50, bus_x + 35, bus_y + 70], fill=(255, 255, 255))
-draw.ellipse([bus_x + 50, bus_y + 50, bus_x + 70, bus_y + 70], fill=(255, 255, 255))
-
-# ============ LOCATION PIN OVERLAY (TOP RIGHT) ============
-
-pin_x, pin_y = 420, 100
-# Pin circle
-draw.ellipse([pin_x - 30, pin_y - 30, pin_x + 30, pin_y + 30], 
-             fill=(30, 64, 175), outline=(251, 191, 36), width=3)
-# Pin point
-pin_point = [(pin_x - 15, pin_y + 35), (pin_x, pin_y + 50), (pin_x + 15, pin_y + 35)]
-draw.polygon(pin_point, fill=(30, 64, 175), outline=(251, 191, 36))
-# Center dot
-draw.ellipse([pin_x - 10, pin_y - 10, pin_x + 10, pin_y + 10], fill=(251, 191, 36))
-
-# ============ TEXT AT BOTTOM ============
-
-try:
-    font = ImageFont.truetype("arial.ttf", 48)
-    small_font = ImageFont.truetype("arial.ttf", 28)
-except:
-    font = ImageFont.load_default()
-    small_font = ImageFont.load_default()
-
-# "WayPro" text
-draw.text((SIZE // 2, 420), "WayPro", font=font, fill=(255, 255, 255), anchor="mm")
-
-# "Pro" highlight
-draw.text((SIZE // 2 + 100, 415), "Pro", font=small_font, fill=(251, 191, 36), anchor="mm")
-
-# Save image
-output_path = "wayprro-app-icon-512x512.png"
-image.save(output_path, 'PNG', optimize=True)
 
-import os
-file_size = os.path.getsize(output_path)
-print(f"✅ App Icon Generated Successfully!")
-print(f"📁 File: {output_path}")
-print(f"📏 Dimensions: 512×512 px (EXACT)")
-print(f"📦 Format: PNG")
-print(f"💾 File Size: {file_size / 1024:.1f} KB")
-print(f"\n✓ Ready to upload to Google Play Console")
+# Repeated bus parts, drawn once and stamped per instance
+SIDE_WINDOW = Stamp((33, 31), lambda d: d.rounded_rectangle(
+    [0, 0, 32, 30], radius=3, fill=(174, 229, 255), outline=(14, 165, 233), width=1))
+LOWER_WINDOW = Stamp((56, 61), lambda d: d.rounded_rectangle(
+    [0, 0, 55, 60], radius=3, fill=(174, 229, 255), outline=(14, 165, 233), width=1))
+
+
+def _draw_wheel(draw):
+    draw.ellipse([0, 0, 80, 80], fill=(15, 23, 42), outline=(75, 85, 99), width=2)
+    draw.ellipse([12, 12, 68, 68], fill=(75, 85, 99))
+    draw.ellipse([24, 24, 56, 56], fill=(55, 65, 81))
+
+
+WHEEL = Stamp((81, 81), _draw_wheel, origin=(40, 40))
+
+# Widest text line that stays inside the round mask at y=420
+TEXT_MAX_WIDTH = 360
+
+
+def create_app_icon(name="WayPro", highlight=None, primary=(30, 64, 175),
+                    primary_dark=(15, 40, 138), accent=(251, 191, 36)):
+    """
+    Render the 512×512 icon with the given branding and return the image.
+    `highlight` defaults to "Pro" only for the WayPro name; pass "" for none.
+    """
+    if highlight is None:
+        highlight = "Pro" if name == "WayPro" else ""
+
+    # Create image with rounded background
+    image = Image.new('RGB', (SIZE, SIZE), color=primary)  # #1e40af - WayPro blue
+    draw = ImageDraw.Draw(image)
+
+    # Create gradient background
+    for y in range(SIZE):
+        ratio = y / SIZE
+        r = int(primary[0] + (primary_dark[0] - primary[0]) * ratio)
+        g = int(primary[1] + (primary_dark[1] - primary[1]) * ratio)
+        b = int(primary[2] + (primary_dark[2] - primary[2]) * ratio)
+        draw.line([(0, y), (SIZE, y)], fill=(r, g, b))
+
+    # Draw rounded corners (create mask for rounded corners)
+    corners = Image.new('L', (SIZE, SIZE), 0)
+    corners_draw = ImageDraw.Draw(corners)
+    corners_draw.ellipse([0, 0, SIZE-1, SIZE-1], fill=255)
+    image.putalpha(corners)
+
+    # ============ SCHOOL BUS ICON (CENTER) ============
+
+    bus_x, bus_y = 100, 180
+    bus_width, bus_height = 312, 160
+
+    # Bus body - main background
+    draw.rectangle([bus_x, bus_y, bus_x + bus_width, bus_y + bus_height], 
+                   fill=accent, outline=(15, 23, 42), width=3)
+
+    # Bus roof
+    roof_points = [
+        (bus_x, bus_y),
+        (bus_x + 60, bus_y - 80),
+        (bus_x + bus_width - 60, bus_y - 80),
+        (bus_x + bus_width, bus_y)
+    ]
+    draw.polygon(roof_points, fill=accent, outline=(15, 23, 42))
+
+    # Front windshield
+    draw.ellipse([bus_x + 20, bus_y - 60, bus_x + 100, bus_y - 10], 
+                 fill=(174, 229, 255), outline=(14, 165, 233), width=2)
+
+    # Side windows (5 windows)
+    SIDE_WINDOW.stamp(image, [(bus_x + 120 + (i * 45), bus_y - 50) for i in range(5)])
+
+    # Lower windows (4)
+    LOWER_WINDOW.stamp(image, [(bus_x + 40 + (i * 75), bus_y + 80) for i in range(4)])
+
+    # Wheels (front and rear)
+    wheel_y = bus_y + bus_height + 20
+    WHEEL.stamp(image, [(bus_x + 40, wheel_y), (bus_x + bus_width - 40, wheel_y)])
+
+    # Headlights
+    draw.ellipse([bus_x + 15, bus_y + 50, bus_x + 35, bus_y + 70], fill=(255, 255, 255))
+    draw.ellipse([bus_x + 50, bus_y + 50, bus_x + 70, bus_y + 70], fill=(255, 255, 255))
+
+    # ============ LOCATION PIN OVERLAY (TOP RIGHT) ============
+
+    pin_x, pin_y = 420, 100
+    # Pin circle
+    draw.ellipse([pin_x - 30, pin_y - 30, pin_x + 30, pin_y + 30], 
+                 fill=primary, outline=accent, width=3)
+    # Pin point
+    pin_point = [(pin_x - 15, pin_y + 35), (pin_x, pin_y + 50), (pin_x + 15, pin_y + 35)]
+    draw.polygon(pin_point, fill=primary, outline=accent)
+    # Center dot
+    draw.ellipse([pin_x - 10, pin_y - 10, pin_x + 10, pin_y + 10], fill=accent)
+
+    # ============ TEXT AT BOTTOM ============
+
+    # Name and highlight are laid out as one centred line, shrunk to fit
+    # inside the circle at this height
+    def line_width(size):
+        width = draw.textlength(name, font=load_font(size))
+        if highlight:
+            width += size // 4 + draw.textlength(highlight, font=load_font(size * 28 // 48))
+        return width
+
+    font_size = fit_font_size(line_width, TEXT_MAX_WIDTH, 48)
+    font = load_font(font_size)
+    small_font = load_font(font_size * 28 // 48)
+    gap = font_size // 4 if highlight else 0
+    name_width = draw.textlength(name, font=font)
+    total_width = line_width(font_size)
+
+    text_x = (SIZE - total_width) / 2
+
+    # App name text
+    draw.text((text_x, 420), name, font=font, fill=(255, 255, 255), anchor="lm")
+
+    # "Pro" highlight
+    if highlight:
+        draw.text((text_x + name_width + gap, 415), highlight, font=small_font, fill=accent, anchor="lm")
+
+    return image
+
+
+def main():
+    """Render the default WayPro icon to disk"""
+    image = create_app_icon()
+
+    # Save image
+    output_path = "wayprro-app-icon-512x512.png"
+    image.save(output_path, 'PNG', optimize=True)
+
+    file_size = os.path.getsize(output_path)
+    print(f"✅ App Icon Generated Successfully!")
+    print(f"📁 File: {output_path}")
+    print(f"📏 Dimensions: 512×512 px (EXACT)")
+    print(f"📦 Format: PNG")
+    print(f"💾 File Size: {file_size / 1024:.1f} KB")
+    print(f"\n✓ Ready to upload to Google Play Console")
+
+if __name__ == "__main__":
+    main()
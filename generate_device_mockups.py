@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+BusWay Pro - Device Mockup Compositor
+Places rendered screenshots into phone, 7-inch and 10-inch tablet frames
+with captions and backgrounds, for every Play Store screenshot size.
+"""
+
+import os
+import sys
+from functools import lru_cache
+
+from PIL import Image, ImageDraw, ImageFilter, ImageFont
+
+from generate_play_store_assets import BLUE, DARK_BLUE, YELLOW, WHITE, DARK_GRAY, hex_to_rgb
+
+SOURCE_DIR = 'play-store-assets/screenshots'
+OUTPUT_DIR = 'play-store-assets/mockups'
+
+# Source renders written by create_screenshots() in generate_play_store_assets.py,
+# in store listing order: (file name, caption key)
+SCREENS = [
+    ("screenshot_1_dashboard.png", "dashboard"),
+    ("screenshot_2_payment.png", "payment"),
+    ("screenshot_3_tracking.png", "tracking"),
+    ("screenshot_4_attendance.png", "attendance"),
+    ("screenshot_5_settings.png", "settings"),
+]
+
+CAPTIONS = {
+    "en": {
+        "dashboard": "All your bus fees\nin one place",
+        "payment": "Pay fees instantly\nwith UPI",
+        "tracking": "Track the school bus\nin real time",
+        "attendance": "Daily boarding\nattendance",
+        "settings": "Settings that fit\nyour family",
+    },
+}
+
+# Device geometry is relative to the device width so one spec serves every
+# output size. "aspect" is the screen width / height.
+DEVICES = {
+    "phone": {
+        "sizes": [(1080, 1920), (1242, 2208)],
+        "aspect": 9 / 16,
+        "bezel": 0.035,
+        "radius": 0.12,
+        "screen_radius": 0.08,
+        "body": (17, 24, 39),
+    },
+    "tablet-7inch": {
+        "sizes": [(1080, 1920)],
+        "aspect": 10 / 16,
+        "bezel": 0.05,
+        "radius": 0.06,
+        "screen_radius": 0.02,
+        "body": (31, 41, 55),
+    },
+    "tablet-10inch": {
+        "sizes": [(1200, 1920), (1600, 2560)],
+        "aspect": 10 / 16,
+        "bezel": 0.045,
+        "radius": 0.05,
+        "screen_radius": 0.015,
+        "body": (31, 41, 55),
+    },
+}
+
+CAPTION_BAND = 0.17   # Fraction of canvas height reserved for the caption
+SIDE_MARGIN = 0.09    # Fraction of canvas width left free on each side
+BOTTOM_MARGIN = 0.04  # Fraction of canvas height below the device
+
+
+@lru_cache(maxsize=None)
+def load_font(size):
+    """Load the caption font at the given size, falling back to Pillow's default"""
+    for name in ("arialbd.ttf", "arial.ttf", "DejaVuSans-Bold.ttf"):
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    return ImageFont.load_default()
+
+
+def device_layout(device, canvas_size):
+    """Return (device_box, screen_box) for a device centred on the canvas"""
+    spec = DEVICES[device]
+    width, height = canvas_size
+    bezel = spec["bezel"]
+
+    avail_w = width * (1 - 2 * SIDE_MARGIN)
+    avail_h = height * (1 - CAPTION_BAND - BOTTOM_MARGIN)
+    # Device height as a multiple of its width, bezels included
+    height_ratio = (1 - 2 * bezel) / spec["aspect"] + 2 * bezel
+    dev_w = int(min(avail_w, avail_h / height_ratio))
+    dev_h = int(dev_w * height_ratio)
+    border = int(dev_w * bezel)
+
+    x0 = (width - dev_w) // 2
+    y0 = int(height * CAPTION_BAND)
+    device_box = (x0, y0, x0 + dev_w, y0 + dev_h)
+    screen_box = (x0 + border, y0 + border, x0 + dev_w - border, y0 + dev_h - border)
+    return device_box, screen_box
+
+
+@lru_cache(maxsize=None)
+def device_frame(device, canvas_size):
+    """
+    Build the frame, screen mask and shadow mask for a device at one canvas size.
+    Cached so every screenshot and locale reuses the same images; callers must
+    treat the returned images as read-only.
+    """
+    spec = DEVICES[device]
+    device_box, screen_box = device_layout(device, canvas_size)
+    dev_w = device_box[2] - device_box[0]
+    dev_h = device_box[3] - device_box[1]
+    scr_w = screen_box[2] - screen_box[0]
+    scr_h = screen_box[3] - screen_box[1]
+    border = screen_box[0] - device_box[0]
+
+    # Frame body with a transparent hole where the screen goes
+    frame = Image.new('RGBA', (dev_w, dev_h), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(frame)
+    draw.rounded_rectangle([0, 0, dev_w - 1, dev_h - 1], radius=int(dev_w * spec["radius"]),
+                           fill=spec["body"] + (255,), outline=(75, 85, 99, 255), width=max(2, dev_w // 300))
+    screen_radius = int(dev_w * spec["screen_radius"])
+    draw.rounded_rectangle([border, border, border + scr_w - 1, border + scr_h - 1],
+                           radius=screen_radius, fill=(0, 0, 0, 0))
+    # Front camera dot centred in the top bezel
+    cam = max(3, border // 5)
+    draw.ellipse([dev_w // 2 - cam, border // 2 - cam, dev_w // 2 + cam, border // 2 + cam],
+                 fill=(55, 65, 81, 255))
+
+    screen_mask = Image.new('L', (scr_w, scr_h), 0)
+    ImageDraw.Draw(screen_mask).rounded_rectangle([0, 0, scr_w - 1, scr_h - 1],
+                                                  radius=screen_radius, fill=255)
+
+    # Soft drop shadow, rendered at a quarter size and scaled up once
+    pad = dev_w // 12
+    small = Image.new('L', ((dev_w + 2 * pad) // 4, (dev_h + 2 * pad) // 4), 0)
+    ImageDraw.Draw(small).rounded_rectangle(
+        [pad // 4, pad // 4, (pad + dev_w) // 4, (pad + dev_h) // 4],
+        radius=int(dev_w * spec["radius"]) // 4, fill=110)
+    small = small.filter(ImageFilter.GaussianBlur(pad // 12 or 1))
+    shadow = small.resize((dev_w + 2 * pad, dev_h + 2 * pad), Image.BILINEAR)
+
+    return frame, screen_mask, shadow, pad
+
+
+@lru_cache(maxsize=None)
+def background(canvas_size, top=DARK_BLUE, bottom=BLUE):
+    """Vertical gradient background, built as one column and stretched"""
+    width, height = canvas_size
+    top, bottom = hex_to_rgb(top), hex_to_rgb(bottom)
+    column = Image.new('RGB', (1, height))
+    column.putdata([
+        tuple(int(top[c] + (bottom[c] - top[c]) * y / height) for c in range(3))
+        for y in range(height)
+    ])
+    return column.resize(canvas_size, Image.NEAREST)
+
+
+def fit_screen(image, size):
+    """
+    Scale a render to cover `size`. Horizontal overflow is cropped evenly,
+    vertical overflow from the bottom so the status bar and header stay visible.
+    Large downscales go through Image.reduce() first so only one resampling
+    pass runs on an image close to the target size.
+    """
+    dst_w, dst_h = size
+    src_w, src_h = image.size
+
+    # Crop to the target aspect ratio before any resampling
+    if src_w * dst_h > dst_w * src_h:
+        crop_w = src_h * dst_w // dst_h
+        left = (src_w - crop_w) // 2
+        image = image.crop((left, 0, left + crop_w, src_h))
+    else:
+        image = image.crop((0, 0, src_w, src_w * dst_h // dst_w))
+
+    factor = min(image.width // dst_w, image.height // dst_h)
+    if factor >= 2:
+        image = image.reduce(factor)
+    if image.size != size:
+        image = image.resize(size, Image.LANCZOS)
+    return image
+
+
+@lru_cache(maxsize=None)
+def load_render(path):
+    """Load a source render once, flattened to RGB"""
+    with Image.open(path) as image:
+        return image.convert('RGB')
+
+
+@lru_cache(maxsize=64)
+def fitted_screen(path, size):
+    """Source render scaled for one screen size; shared between locales"""
+    return fit_screen(load_render(path), size)
+
+
+def compose_mockup(render_path, device, canvas_size, caption):
+    """Composite one render into a device frame with a caption on a background"""
+    device_box, screen_box = device_layout(device, canvas_size)
+    frame, screen_mask, shadow, pad = device_frame(device, canvas_size)
+    screen = fitted_screen(render_path, screen_mask.size)
+
+    canvas = background(canvas_size).copy()
+    canvas.paste(hex_to_rgb(DARK_GRAY), (device_box[0] - pad, device_box[1] - pad + pad // 3), shadow)
+    canvas.paste(frame, device_box[:2], frame)
+    canvas.paste(screen, screen_box[:2], screen_mask)
+
+    width, height = canvas_size
+    font = load_font(int(width * 0.058))
+    draw = ImageDraw.Draw(canvas)
+    draw.multiline_text((width // 2, int(height * 0.035)), caption, font=font,
+                        fill=hex_to_rgb(WHITE), anchor="ma", align="center", spacing=int(width * 0.015))
+    # Accent underline below the caption
+    line_y = int(height * CAPTION_BAND) - int(height * 0.02)
+    draw.line([(width // 2 - width // 14, line_y), (width // 2 + width // 14, line_y)],
+              fill=hex_to_rgb(YELLOW), width=max(4, width // 200))
+    return canvas
+
+
+def create_mockups(source_dir=SOURCE_DIR, output_dir=OUTPUT_DIR, locales=None):
+    """Render every device, store size and locale from one set of source renders"""
+    locales = locales or list(CAPTIONS)
+    created = 0
+
+    for locale in locales:
+        captions = CAPTIONS[locale]
+        for device, spec in DEVICES.items():
+            device_dir = os.path.join(output_dir, locale, device)
+            os.makedirs(device_dir, exist_ok=True)
+            print(f"  - {locale} / {device}...")
+            for index, (filename, key) in enumerate(SCREENS, start=1):
+                render_path = os.path.join(source_dir, filename)
+                for canvas_size in spec["sizes"]:
+                    mockup = compose_mockup(render_path, device, canvas_size, captions[key])
+                    name = f"{index}_{key}_{canvas_size[0]}x{canvas_size[1]}.png"
+                    mockup.save(os.path.join(device_dir, name))
+                    created += 1
+
+    return f"✓ Created {created} device mockups"
+
+
+def main():
+    """Generate device mockups for all locales"""
+    print("\n" + "="*60)
+    print("BusWay Pro - Device Mockup Compositor")
+    print("="*60 + "\n")
+
+    output_dir = sys.argv[1] if len(sys.argv) > 1 else OUTPUT_DIR
+    try:
+        print(create_mockups(output_dir=output_dir))
+        print(f"\n📁 Files location: {output_dir}/<locale>/<device>/")
+    except Exception as e:
+        print(f"\n❌ ERROR: {str(e)}")
+        print("Run generate_play_store_assets.py first to render the source screenshots")
+        exit(1)
+
+if __name__ == "__main__":
+    main()
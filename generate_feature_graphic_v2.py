@@ -4,133 +4,169 @@ Generate WayPro Pro Feature Graphic - CLEAN VERSION
 Creates: 1024×500 px PNG (optimized for Google Play Store)
 """
 
-from PIL import Image, ImageDraw, ImageFont
 import os
 
+from PIL import Image, ImageDraw
+
+from generate_play_store_assets import fit_font_size, load_font
+from stamping import Stamp
+
 # EXACT dimensions required by Play Store
 WIDTH = 1024
 HEIGHT = 500
 
-# Create new image with solid dark blue background
-image = Image.new('RGB', (WIDTH, HEIGHT), color=(15, 23, 42))  # #0f172a
-draw = ImageDraw.Draw(image)
-
-# Add subtle gradient background
-for y in range(HEIGHT):
-    ratio = y / HEIGHT
-    r = int(15 + (30 - 15) * ratio)
-    g = int(23 + (58 - 23) * ratio)
-    b = int(42 + (138 - 42) * ratio)
-    draw.line([(0, y), (WIDTH, y)], fill=(r, g, b))
-
-# Add decorative circles
-draw.ellipse([850, -80, 1150, 220], outline=(251, 191, 36), width=0, fill=(251, 191, 36, 25))
-draw.ellipse([920, 320, 1200, 600], outline=(30, 58, 138), width=0, fill=(30, 58, 138, 30))
-
-# ==================== SCHOOL BUS ====================
-# Bus body - main rectangle
-draw.rectangle([50, 200, 350, 340], fill=(30, 64, 175), outline=(15, 23, 42), width=2)
-
-# Bus roof - triangular top
-roof_polygon = [(50, 200), (85, 130), (315, 110), (350, 200)]
-draw.polygon(roof_polygon, fill=(30, 58, 138), outline=(15, 23, 42))
-
-# Yellow stripe on roof
-draw.line([(50, 200), (350, 200)], fill=(251, 191, 36), width=12)
-
-# Windows - Front windshield
-draw.rectangle([65, 140, 115, 195], fill=(165, 216, 255), outline=(14, 165, 233), width=1)
-
-# Side windows row 1 (upper)
-for i in range(4):
-    x = 140 + (i * 45)
-    draw.rectangle([x, 155, x + 30, 180], fill=(165, 216, 255), outline=(14, 165, 233), width=1)
-
-# Side windows row 2 (lower - passenger)
-for i in range(4):
-    x = 70 + (i * 65)
-    draw.rectangle([x, 220, x + 50, 300], fill=(165, 216, 255), outline=(14, 165, 233), width=1)
-
-# Wheels - front
-draw.ellipse([70, 330, 130, 390], fill=(31, 41, 55), outline=(75, 85, 99), width=2)
-draw.ellipse([80, 340, 120, 380], fill=(75, 85, 99))
-draw.ellipse([87, 347, 113, 373], fill=(55, 65, 81))
-
-# Wheels - rear
-draw.ellipse([270, 330, 330, 390], fill=(31, 41, 55), outline=(75, 85, 99), width=2)
-draw.ellipse([280, 340, 320, 380], fill=(75, 85, 99))
-draw.ellipse([287, 347, 313, 373], fill=(55, 65, 81))
-
-# Headlights
-draw.ellipse([55, 225, 70, 240], fill=(251, 191, 36))
-draw.ellipse([72, 225, 87, 240], fill=(251, 191, 36))
-
-# Bumper
-draw.rectangle([50, 330, 350, 345], fill=(251, 191, 36))
-
-# ==================== TEXT ====================
-
-# Load fonts
-try:
-    big_font = ImageFont.truetype("arial.ttf", 95)
-    title_font = ImageFont.truetype("arial.ttf", 50)
-    subtitle_font = ImageFont.truetype("arial.ttf", 28)
-    feature_font = ImageFont.truetype("arial.ttf", 22)
-except:
-    big_font = ImageFont.load_default()
-    title_font = ImageFont.load_default()
-    subtitle_font = ImageFont.load_default()
-    feature_font = ImageFont.load_default()
-
-# Main title
-draw.text((420, 35), "WayP", fill=(255, 255, 255), font=big_font)
-draw.text((710, 35), "Pro", fill=(251, 191, 36), font=big_font)
-
-# Tagline
-draw.text((420, 155), "School Bus Fee Manager", fill=(255, 255, 255), font=title_font)
-
-# Subtitle
-draw.text((420, 220), "Safe • Secure • Real-time Tracking", fill=(203, 213, 225), font=subtitle_font)
-
-# Feature list
-feature_y_start = 300
-
-# Location icon + text
-draw.ellipse([440, feature_y_start - 12, 460, feature_y_start + 8], fill=(251, 191, 36))
-draw.ellipse([448, feature_y_start - 5, 452, feature_y_start + 5], fill=(30, 64, 175))
-draw.text((475, feature_y_start - 10), "Live Bus Tracking", fill=(224, 242, 254), font=feature_font)
-
-# Payment icon + text
-feature_y = feature_y_start + 45
-draw.rectangle([440, feature_y - 10, 460, feature_y + 10], outline=(251, 191, 36), width=2)
-draw.line([(440, feature_y), (460, feature_y)], fill=(251, 191, 36), width=2)
-draw.rectangle([443, feature_y + 5, 451, feature_y + 9], fill=(251, 191, 36))
-draw.text((475, feature_y - 10), "Easy Payments", fill=(224, 242, 254), font=feature_font)
-
-# Security icon + text
-feature_y = feature_y_start + 90
-draw.polygon([(450, feature_y - 20), (438, feature_y - 10), (438, feature_y + 10), (450, feature_y + 16), (462, feature_y + 10), (462, feature_y - 10)], 
-             outline=(251, 191, 36), width=2)
-draw.line([(445, feature_y), (450, feature_y + 5), (458, feature_y - 3)], fill=(251, 191, 36), width=2)
-draw.text((475, feature_y - 10), "Secure & Private", fill=(224, 242, 254), font=feature_font)
-
-# Save with high quality
-output_path = "wayprro-feature-graphic-1024x500.png"
-image.save(output_path, 'PNG', optimize=True, quality=95)
-
-# Get file info
-import os
-file_size = os.path.getsize(output_path)
-print(f"✅ Feature Graphic Generated Successfully!")
-print(f"📁 File: {output_path}")
-print(f"📏 Dimensions: {WIDTH}×{HEIGHT} px (EXACT)")
-print(f"📦 Format: PNG (High Quality)")
-print(f"💾 File Size: {file_size / 1024:.1f} KB")
-print(f"\n✓ Ready to upload to Google Play Console")
-print(f"\nUpload Instructions:")
-print(f"1. Open: https://play.google.com/console")
-print(f"2. Select your app 'WayPro Pro'")
-print(f"3. Go to: Store listing → Graphics")
-print(f"4. Click 'Feature graphic' upload area")
-print(f"5. Select: {output_path}")
-print(f"6. Click Save")
+# Text column starts at x=420 and keeps a margin from the right edge
+TEXT_X = 420
+TEXT_MAX_WIDTH = WIDTH - TEXT_X - 40
+
+# Repeated bus parts, drawn once and stamped per instance
+UPPER_WINDOW = Stamp((31, 26), lambda d: d.rectangle(
+    [0, 0, 30, 25], fill=(165, 216, 255), outline=(14, 165, 233), width=1))
+LOWER_WINDOW = Stamp((51, 81), lambda d: d.rectangle(
+    [0, 0, 50, 80], fill=(165, 216, 255), outline=(14, 165, 233), width=1))
+
+
+def _draw_wheel(draw):
+    draw.ellipse([0, 0, 60, 60], fill=(31, 41, 55), outline=(75, 85, 99), width=2)
+    draw.ellipse([10, 10, 50, 50], fill=(75, 85, 99))
+    draw.ellipse([17, 17, 43, 43], fill=(55, 65, 81))
+
+
+WHEEL = Stamp((61, 61), _draw_wheel)
+
+
+def create_feature_graphic(title="WayP", title_highlight=None, tagline="School Bus Fee Manager",
+                           subtitle="Safe • Secure • Real-time Tracking", primary=(30, 64, 175),
+                           primary_dark=(30, 58, 138), background=(15, 23, 42), accent=(251, 191, 36)):
+    """
+    Render the 1024×500 feature graphic with the given branding and return the image.
+    `title_highlight` defaults to "Pro" only for the WayP title; pass "" for none.
+    """
+    if title_highlight is None:
+        title_highlight = "Pro" if title == "WayP" else ""
+
+    # Create new image with solid dark blue background
+    image = Image.new('RGB', (WIDTH, HEIGHT), color=background)  # #0f172a
+    draw = ImageDraw.Draw(image)
+
+    # Add subtle gradient background
+    for y in range(HEIGHT):
+        ratio = y / HEIGHT
+        r = int(background[0] + (primary_dark[0] - background[0]) * ratio)
+        g = int(background[1] + (primary_dark[1] - background[1]) * ratio)
+        b = int(background[2] + (primary_dark[2] - background[2]) * ratio)
+        draw.line([(0, y), (WIDTH, y)], fill=(r, g, b))
+
+    # Add decorative circles
+    draw.ellipse([850, -80, 1150, 220], outline=accent, width=0, fill=accent + (25,))
+    draw.ellipse([920, 320, 1200, 600], outline=primary_dark, width=0, fill=primary_dark + (30,))
+
+    # ==================== SCHOOL BUS ====================
+    # Bus body - main rectangle
+    draw.rectangle([50, 200, 350, 340], fill=primary, outline=(15, 23, 42), width=2)
+
+    # Bus roof - triangular top
+    roof_polygon = [(50, 200), (85, 130), (315, 110), (350, 200)]
+    draw.polygon(roof_polygon, fill=primary_dark, outline=(15, 23, 42))
+
+    # Yellow stripe on roof
+    draw.line([(50, 200), (350, 200)], fill=accent, width=12)
+
+    # Windows - Front windshield
+    draw.rectangle([65, 140, 115, 195], fill=(165, 216, 255), outline=(14, 165, 233), width=1)
+
+    # Side windows row 1 (upper)
+    UPPER_WINDOW.stamp(image, [(140 + (i * 45), 155) for i in range(4)])
+
+    # Side windows row 2 (lower - passenger)
+    LOWER_WINDOW.stamp(image, [(70 + (i * 65), 220) for i in range(4)])
+
+    # Wheels - front and rear
+    WHEEL.stamp(image, [(70, 330), (270, 330)])
+
+    # Headlights
+    draw.ellipse([55, 225, 70, 240], fill=accent)
+    draw.ellipse([72, 225, 87, 240], fill=accent)
+
+    # Bumper
+    draw.rectangle([50, 330, 350, 345], fill=accent)
+
+    # ==================== TEXT ====================
+
+    # Load fonts, shrinking each text line to fit the text column
+    def title_width(size):
+        width = draw.textlength(title, font=load_font(size))
+        if title_highlight:
+            width += 20 + draw.textlength(title_highlight, font=load_font(size))
+        return width
+
+    big_font = load_font(fit_font_size(title_width, TEXT_MAX_WIDTH, 95))
+    title_font = load_font(fit_font_size(
+        lambda size: draw.textlength(tagline, font=load_font(size)), TEXT_MAX_WIDTH, 50))
+    subtitle_font = load_font(fit_font_size(
+        lambda size: draw.textlength(subtitle, font=load_font(size)), TEXT_MAX_WIDTH, 28))
+    feature_font = load_font(22)
+
+    # Main title
+    draw.text((TEXT_X, 35), title, fill=(255, 255, 255), font=big_font)
+    if title_highlight:
+        highlight_x = TEXT_X + draw.textlength(title, font=big_font) + 20
+        draw.text((highlight_x, 35), title_highlight, fill=accent, font=big_font)
+
+    # Tagline
+    draw.text((TEXT_X, 155), tagline, fill=(255, 255, 255), font=title_font)
+
+    # Subtitle
+    draw.text((TEXT_X, 220), subtitle, fill=(203, 213, 225), font=subtitle_font)
+
+    # Feature list
+    feature_y_start = 300
+
+    # Location icon + text
+    draw.ellipse([440, feature_y_start - 12, 460, feature_y_start + 8], fill=accent)
+    draw.ellipse([448, feature_y_start - 5, 452, feature_y_start + 5], fill=primary)
+    draw.text((475, feature_y_start - 10), "Live Bus Tracking", fill=(224, 242, 254), font=feature_font)
+
+    # Payment icon + text
+    feature_y = feature_y_start + 45
+    draw.rectangle([440, feature_y - 10, 460, feature_y + 10], outline=accent, width=2)
+    draw.line([(440, feature_y), (460, feature_y)], fill=accent, width=2)
+    draw.rectangle([443, feature_y + 5, 451, feature_y + 9], fill=accent)
+    draw.text((475, feature_y - 10), "Easy Payments", fill=(224, 242, 254), font=feature_font)
+
+    # Security icon + text
+    feature_y = feature_y_start + 90
+    draw.polygon([(450, feature_y - 20), (438, feature_y - 10), (438, feature_y + 10), (450, feature_y + 16), (462, feature_y + 10), (462, feature_y - 10)], 
+                 outline=accent, width=2)
+    draw.line([(445, feature_y), (450, feature_y + 5), (458, feature_y - 3)], fill=accent, width=2)
+    draw.text((475, feature_y - 10), "Secure & Private", fill=(224, 242, 254), font=feature_font)
+
+    return image
+
+
+def main():
+    """Render the default WayPro feature graphic to disk"""
+    image = create_feature_graphic()
+
+    # Save with high quality
+    output_path = "wayprro-feature-graphic-1024x500.png"
+    image.save(output_path, 'PNG', optimize=True, quality=95)
+
+    # Get file info
+    file_size = os.path.getsize(output_path)
+    print(f"✅ Feature Graphic Generated Successfully!")
+    print(f"📁 File: {output_path}")
+    print(f"📏 Dimensions: {WIDTH}×{HEIGHT} px (EXACT)")
+    print(f"📦 Format: PNG (High Quality)")
+    print(f"💾 File Size: {file_size / 1024:.1f} KB")
+    print(f"\n✓ Ready to upload to Google Play Console")
+    print(f"\nUpload Instructions:")
+    print(f"1. Open: https://play.google.com/console")
+    print(f"2. Select your app 'WayPro Pro'")
+    print(f"3. Go to: Store listing → Graphics")
+    print(f"4. Click 'Feature graphic' upload area")
+    print(f"5. Select: {output_path}")
+    print(f"6. Click Save")
+
+if __name__ == "__main__":
+    main()
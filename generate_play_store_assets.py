@@ -6,8 +6,12 @@ Generates all required images for Play Store submission
 
 from PIL import Image, ImageDraw, ImageFont
 import os
+from functools import lru_cache
 from pathlib import Path
 
+from offline_map_renderer import load_extract, render_map
+from stamping import Stamp, TextSlot
+
 # Color scheme
 BLUE = "#1e40af"          # Primary blue
 YELLOW = "#fbbf24"        # School bus yellow
@@ -16,6 +20,9 @@ WHITE = "#ffffff"
 DARK_GRAY = "#1f2937"
 LIGHT_GRAY = "#f3f4f6"
 
+# Local GeoJSON/OSM extract for the tracking screenshot map
+MAP_EXTRACT = "play-store-assets/map/sample_extract.geojson"
+
 # Ensure Pillow is available
 try:
     from PIL import Image, ImageDraw, ImageFont
@@ -28,6 +35,24 @@ def hex_to_rgb(hex_color):
     hex_color = hex_color.lstrip('#')
     return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
 
+@lru_cache(maxsize=None)
+def load_font(size):
+    """Load Arial at the given size, falling back to Pillow's default font"""
+    try:
+        return ImageFont.truetype("arial.ttf", size)
+    except OSError:
+        try:
+            return ImageFont.load_default(size)
+        except TypeError:
+            # Pillow < 10.1 has no sized default font
+            return ImageFont.load_default()
+
+def fit_font_size(measure, max_width, size, min_size=8):
+    """Shrink `size` in 2 px steps until measure(size) fits within max_width"""
+    while size > min_size and measure(size) > max_width:
+        size -= 2
+    return size
+
 def create_app_icon():
     """Create 512x512 app icon with school bus design"""
     print("Creating app icon (512x512)...")
@@ -58,10 +83,9 @@ def create_app_icon():
     window_height = 40
     window_width = 45
     
-    for i in range(3):
-        window_x = bus_x + 30 + (i * 65)
-        draw.rectangle([window_x, window_y, window_x + window_width, window_y + window_height],
-                       fill=hex_to_rgb(BLUE), outline=hex_to_rgb(DARK_GRAY), width=2)
+    window = Stamp((window_width + 1, window_height + 1), lambda d: d.rectangle(
+        [0, 0, window_width, window_height], fill=hex_to_rgb(BLUE), outline=hex_to_rgb(DARK_GRAY), width=2))
+    window.stamp(img, [(bus_x + 30 + (i * 65), window_y) for i in range(3)])
     
     # Draw wheels
     wheel_radius = 20
@@ -69,18 +93,15 @@ def create_app_icon():
     wheel1_x = bus_x + 50
     wheel2_x = bus_x + bus_width - 50
     
-    draw.ellipse([wheel1_x - wheel_radius, wheel_y - wheel_radius, 
-                  wheel1_x + wheel_radius, wheel_y + wheel_radius],
-                 fill=hex_to_rgb(DARK_GRAY), outline=hex_to_rgb(WHITE), width=2)
-    draw.ellipse([wheel2_x - wheel_radius, wheel_y - wheel_radius, 
-                  wheel2_x + wheel_radius, wheel_y + wheel_radius],
-                 fill=hex_to_rgb(DARK_GRAY), outline=hex_to_rgb(WHITE), width=2)
-    
-    # Draw wheel centers
-    draw.ellipse([wheel1_x - 5, wheel_y - 5, wheel1_x + 5, wheel_y + 5],
-                 fill=hex_to_rgb(WHITE))
-    draw.ellipse([wheel2_x - 5, wheel_y - 5, wheel2_x + 5, wheel_y + 5],
-                 fill=hex_to_rgb(WHITE))
+    def draw_wheel(d):
+        d.ellipse([0, 0, 2 * wheel_radius, 2 * wheel_radius],
+                  fill=hex_to_rgb(DARK_GRAY), outline=hex_to_rgb(WHITE), width=2)
+        # Wheel center
+        d.ellipse([wheel_radius - 5, wheel_radius - 5, wheel_radius + 5, wheel_radius + 5],
+                  fill=hex_to_rgb(WHITE))
+
+    wheel = Stamp((2 * wheel_radius + 1, 2 * wheel_radius + 1), draw_wheel, origin=(wheel_radius, wheel_radius))
+    wheel.stamp(img, [(wheel1_x, wheel_y), (wheel2_x, wheel_y)])
     
     img.save('play-store-assets/app-icon/app_icon_512x512.png')
     return "✓ App icon created"
@@ -103,13 +124,11 @@ def create_feature_graphic():
         draw.line([(0, y), (width, y)], fill=(r, g, b))
     
     # Add decorative elements
-    for i in range(5):
-        circle_x = 100 + i * 150
-        circle_y = 50
-        circle_size = 80
-        draw.ellipse([circle_x - circle_size, circle_y - circle_size, 
-                      circle_x + circle_size, circle_y + circle_size],
-                     outline=hex_to_rgb(YELLOW), width=3)
+    circle_size = 80
+    circle = Stamp((2 * circle_size + 1, 2 * circle_size + 1), lambda d: d.ellipse(
+        [0, 0, 2 * circle_size, 2 * circle_size], outline=hex_to_rgb(YELLOW), width=3),
+        origin=(circle_size, circle_size))
+    circle.stamp(img, [(100 + i * 150, 50) for i in range(5)])
     
     # Add school bus icon on right side
     bus_x = width - 250
@@ -121,10 +140,9 @@ def create_feature_graphic():
                    fill=hex_to_rgb(YELLOW), outline=hex_to_rgb(WHITE), width=2)
     
     # Windows
-    for i in range(2):
-        wx = bus_x + 20 + (i * 45)
-        draw.rectangle([wx, bus_y + 15, wx + 35, bus_y + 45],
-                       fill=hex_to_rgb(BLUE), outline=hex_to_rgb(WHITE), width=1)
+    window = Stamp((36, 31), lambda d: d.rectangle(
+        [0, 0, 35, 30], fill=hex_to_rgb(BLUE), outline=hex_to_rgb(WHITE), width=1))
+    window.stamp(img, [(bus_x + 20 + (i * 45), bus_y + 15) for i in range(2)])
     
     # Wheels
     draw.ellipse([bus_x + 20 - 8, bus_y + bus_height + 5, bus_x + 20 + 8, bus_y + bus_height + 20],
@@ -217,11 +235,15 @@ def create_screenshots():
     draw.rectangle([0, 50, width, 150], fill=hex_to_rgb(LIGHT_GRAY))
     draw.text((30, 70), "Bus Tracking", fill=hex_to_rgb(DARK_BLUE))
     
-    # Map area (placeholder)
-    draw.rectangle([30, 200, width - 30, 1000], fill=hex_to_rgb(LIGHT_GRAY), 
-                   outline=hex_to_rgb(BLUE), width=2)
-    draw.text((width // 2 - 100, 500), "📍 Map View", fill=hex_to_rgb(DARK_GRAY))
-    draw.text((width // 2 - 150, 600), "Real-time Bus Location", fill=hex_to_rgb(DARK_BLUE))
+    # Map area, rendered offline from the local extract when available
+    if os.path.exists(MAP_EXTRACT):
+        img.paste(render_map(load_extract(MAP_EXTRACT), (width - 63, 797)), (32, 202))
+        draw.rectangle([30, 200, width - 30, 1000], outline=hex_to_rgb(BLUE), width=2)
+    else:
+        draw.rectangle([30, 200, width - 30, 1000], fill=hex_to_rgb(LIGHT_GRAY), 
+                       outline=hex_to_rgb(BLUE), width=2)
+        draw.text((width // 2 - 100, 500), "📍 Map View", fill=hex_to_rgb(DARK_GRAY))
+        draw.text((width // 2 - 150, 600), "Real-time Bus Location", fill=hex_to_rgb(DARK_BLUE))
     
     # Bus info
     draw.rectangle([30, 1100, width - 30, 1300], fill=hex_to_rgb(LIGHT_GRAY), 
@@ -244,17 +266,12 @@ def create_screenshots():
     # Attendance data
     draw.text((30, 200), "March 2024", fill=hex_to_rgb(DARK_BLUE))
     
-    for day in range(1, 22):
-        row = (day - 1) // 5
-        col = (day - 1) % 5
-        x = 50 + (col * 180)
-        y = 300 + (row * 120)
-        
-        # Attendance box
-        draw.rectangle([x, y, x + 150, y + 80], fill=hex_to_rgb(LIGHT_GRAY), 
-                       outline=hex_to_rgb(BLUE), width=1)
-        draw.text((x + 20, y + 15), f"Day {day}", fill=hex_to_rgb(DARK_BLUE))
-        draw.text((x + 20, y + 45), "✓ Present", fill=hex_to_rgb(BLUE))
+    # Attendance boxes: one cell stamped across a 5-column grid
+    cell = Stamp((151, 81), lambda d: d.rectangle(
+        [0, 0, 150, 80], fill=hex_to_rgb(LIGHT_GRAY), outline=hex_to_rgb(BLUE), width=1),
+        text_slots=[TextSlot((20, 15), hex_to_rgb(DARK_BLUE)), TextSlot((20, 45), hex_to_rgb(BLUE))])
+    cell.stamp_grid(img, (50, 300), (180, 120), count=21, cols=5,
+                    texts=[(f"Day {day}", "✓ Present") for day in range(1, 22)])
     
     img.save('play-store-assets/screenshots/screenshot_4_attendance.png')
     screenshots.append("screenshot_4_attendance.png")
@@ -278,12 +295,11 @@ def create_screenshots():
         "Logout"
     ]
     
-    for i, setting in enumerate(settings):
-        setting_y = 200 + (i * 200)
-        draw.rectangle([30, setting_y, width - 30, setting_y + 150],
-                       fill=hex_to_rgb(LIGHT_GRAY), outline=hex_to_rgb(BLUE), width=2)
-        draw.text((50, setting_y + 40), setting, fill=hex_to_rgb(DARK_BLUE))
-        draw.text((50, setting_y + 90), "Tap to configure →", fill=hex_to_rgb(DARK_GRAY))
+    card = Stamp((width - 59, 151), lambda d: d.rectangle(
+        [0, 0, width - 60, 150], fill=hex_to_rgb(LIGHT_GRAY), outline=hex_to_rgb(BLUE), width=2),
+        text_slots=[TextSlot((20, 40), hex_to_rgb(DARK_BLUE)), TextSlot((20, 90), hex_to_rgb(DARK_GRAY))])
+    card.stamp(img, [(30, 200 + (i * 200)) for i in range(len(settings))],
+               texts=[(setting, "Tap to configure →") for setting in settings])
     
     img.save('play-store-assets/screenshots/screenshot_5_settings.png')
     screenshots.append("screenshot_5_settings.png")
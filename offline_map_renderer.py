@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+BusWay Pro - Offline Map Renderer
+Draws roads, the bus route, stops and the bus marker from a local GeoJSON
+or OSM XML extract, without a tile server. Features are held in a uniform
+grid index so a render only reads the features inside the viewport.
+"""
+
+import json
+import math
+import sys
+import xml.etree.ElementTree as ET
+
+from PIL import Image, ImageDraw
+
+# Road styling by OSM highway class: (line width in px, colour)
+ROAD_STYLES = {
+    "motorway": (14, (253, 186, 116)),
+    "trunk": (12, (253, 186, 116)),
+    "primary": (11, (254, 215, 170)),
+    "secondary": (9, (254, 240, 138)),
+    "tertiary": (8, (255, 255, 255)),
+    "residential": (6, (255, 255, 255)),
+    "service": (4, (255, 255, 255)),
+}
+DEFAULT_ROAD_STYLE = (5, (255, 255, 255))
+ROAD_CASING = (203, 213, 225)
+
+LAND = (241, 245, 249)
+ROUTE_COLOR = (30, 64, 175)
+STOP_COLOR = (16, 185, 129)
+BUS_COLOR = (251, 191, 36)
+OUTLINE = (15, 23, 42)
+
+EARTH_RADIUS = 6378137.0
+
+
+def project(lon, lat):
+    """Project WGS84 degrees to Web Mercator metres (y grows northwards)"""
+    lat = max(min(lat, 85.05112878), -85.05112878)
+    x = math.radians(lon) * EARTH_RADIUS
+    y = math.log(math.tan(math.pi / 4 + math.radians(lat) / 2)) * EARTH_RADIUS
+    return x, y
+
+
+def bbox_of(points):
+    """Bounding box (min_x, min_y, max_x, max_y) of projected points"""
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+class MapFeature:
+    """A projected map feature: road, route, stop or bus"""
+
+    __slots__ = ("kind", "points", "bbox", "props")
+
+    def __init__(self, kind, points, props=None):
+        self.kind = kind
+        self.points = points
+        self.bbox = bbox_of(points)
+        self.props = props or {}
+
+
+class GridIndex:
+    """
+    Uniform grid spatial index over map features.
+    Lines are registered in the cells along each segment rather than every
+    cell of their bbox, so long diagonal ways stay cheap; a query walks only
+    the cells covering the requested box.
+    """
+
+    def __init__(self, features, cell_size=None):
+        self.features = list(features)
+        self.cells = {}
+        self.extent = None
+        self.route_extent = None
+        if not self.features:
+            self.cell_size = cell_size or 1.0
+            return
+
+        min_x, min_y, max_x, max_y = self.extent = (
+            min(f.bbox[0] for f in self.features), min(f.bbox[1] for f in self.features),
+            max(f.bbox[2] for f in self.features), max(f.bbox[3] for f in self.features),
+        )
+        if cell_size is None:
+            # Aim for roughly one feature per cell on average
+            area = max((max_x - min_x) * (max_y - min_y), 1.0)
+            cell_size = max(math.sqrt(area / len(self.features)), 1.0)
+        self.cell_size = cell_size
+
+        route = [f.bbox for f in self.features if f.kind in ("route", "stop", "bus")]
+        if route:
+            self.route_extent = (min(b[0] for b in route), min(b[1] for b in route),
+                                 max(b[2] for b in route), max(b[3] for b in route))
+
+        for idx, feature in enumerate(self.features):
+            for cell in self._cells_along(feature.points):
+                self.cells.setdefault(cell, []).append(idx)
+
+    def _cells_along(self, points):
+        """Cells touched by a point or polyline, walked in steps of one cell"""
+        if len(points) == 1:
+            x, y = points[0]
+            return set(self._cells_for((x, y, x, y)))
+        size = self.cell_size
+        cells = set()
+        for (ax, ay), (bx, by) in zip(points, points[1:]):
+            steps = max(1, int(math.ceil(max(abs(bx - ax), abs(by - ay)) / size)))
+            prev = (ax, ay)
+            for i in range(1, steps + 1):
+                t = i / steps
+                cur = (ax + (bx - ax) * t, ay + (by - ay) * t)
+                # Each step spans at most one cell per axis, so its bbox is 1-4 cells
+                cells.update(self._cells_for((min(prev[0], cur[0]), min(prev[1], cur[1]),
+                                              max(prev[0], cur[0]), max(prev[1], cur[1]))))
+                prev = cur
+        return cells
+
+    def _cells_for(self, bbox):
+        size = self.cell_size
+        x0, y0 = int(math.floor(bbox[0] / size)), int(math.floor(bbox[1] / size))
+        x1, y1 = int(math.floor(bbox[2] / size)), int(math.floor(bbox[3] / size))
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                yield cx, cy
+
+    def query(self, bbox):
+        """Return the features whose bbox intersects `bbox`, in insertion order"""
+        if self.extent is None:
+            return []
+        # Clamp to the indexed extent so a huge viewport doesn't walk empty cells
+        clamped = (max(bbox[0], self.extent[0]), max(bbox[1], self.extent[1]),
+                   min(bbox[2], self.extent[2]), min(bbox[3], self.extent[3]))
+        if clamped[0] > clamped[2] or clamped[1] > clamped[3]:
+            return []
+        hits = set()
+        for cell in self._cells_for(clamped):
+            hits.update(self.cells.get(cell, ()))
+        min_x, min_y, max_x, max_y = bbox
+        found = []
+        for idx in sorted(hits):
+            f = self.features[idx]
+            if f.bbox[0] <= max_x and f.bbox[2] >= min_x and f.bbox[1] <= max_y and f.bbox[3] >= min_y:
+                found.append(f)
+        return found
+
+
+def _is_bus_stop(tags):
+    """True for OSM tags that mark a bus stop"""
+    return tags.get("highway") == "bus_stop" or tags.get("public_transport") == "platform"
+
+
+def _geojson_features(data):
+    """Yield MapFeatures from a GeoJSON FeatureCollection"""
+    for item in data.get("features", []):
+        geometry = item.get("geometry") or {}
+        props = item.get("properties") or {}
+        gtype = geometry.get("type")
+        coords = geometry.get("coordinates")
+
+        if gtype == "Point":
+            # Only bus stops and the bus itself are drawn; other POIs are skipped
+            kind = props.get("kind")
+            if kind is None and _is_bus_stop(props):
+                kind = "stop"
+            if kind in ("stop", "bus"):
+                yield MapFeature(kind, [project(*coords[:2])], props)
+        elif gtype in ("LineString", "MultiLineString"):
+            lines = [coords] if gtype == "LineString" else coords
+            kind = props.get("kind") or ("road" if "highway" in props else None)
+            if kind is None:
+                continue
+            for line in lines:
+                if len(line) >= 2:
+                    yield MapFeature(kind, [project(*c[:2]) for c in line], props)
+
+
+def _osm_features(root):
+    """Yield road and bus stop MapFeatures from an OSM XML extract"""
+    nodes = {}
+    for n in root.iter("node"):
+        point = nodes[n.get("id")] = project(float(n.get("lon")), float(n.get("lat")))
+        tags = {t.get("k"): t.get("v") for t in n.iter("tag")}
+        if _is_bus_stop(tags):
+            yield MapFeature("stop", [point], tags)
+    for way in root.iter("way"):
+        tags = {t.get("k"): t.get("v") for t in way.iter("tag")}
+        if "highway" not in tags:
+            continue
+        points = [nodes[nd.get("ref")] for nd in way.iter("nd") if nd.get("ref") in nodes]
+        if len(points) >= 2:
+            yield MapFeature("road", points, tags)
+
+
+def load_extract(path):
+    """Load a .geojson/.json or .osm extract into a GridIndex"""
+    if path.endswith(".osm"):
+        features = _osm_features(ET.parse(path).getroot())
+    else:
+        with open(path, encoding="utf-8") as fh:
+            features = _geojson_features(json.load(fh))
+    return GridIndex(features)
+
+
+def fit_viewport(bbox, size, padding=0.12):
+    """Expand `bbox` by `padding` and to the aspect ratio of `size`"""
+    min_x, min_y, max_x, max_y = bbox
+    w = max(max_x - min_x, 1.0) * (1 + 2 * padding)
+    h = max(max_y - min_y, 1.0) * (1 + 2 * padding)
+    aspect = size[0] / size[1]
+    if w / h < aspect:
+        w = h * aspect
+    else:
+        h = w / aspect
+    cx, cy = (min_x + max_x) / 2, (min_y + max_y) / 2
+    return cx - w / 2, cy - h / 2, cx + w / 2, cy + h / 2
+
+
+def render_map(index, size, viewport=None, scale=1.0):
+    """
+    Render the features of `index` inside `viewport` onto a new RGB image.
+    The viewport defaults to the route extent, falling back to the whole index.
+    """
+    width, height = size
+    if viewport is None:
+        if index.route_extent is not None:
+            viewport = fit_viewport(index.route_extent, size)
+        elif index.extent is not None:
+            viewport = fit_viewport(index.extent, size, padding=0)
+        else:
+            return Image.new('RGB', size, LAND)
+
+    min_x, min_y, max_x, max_y = viewport
+    sx = width / (max_x - min_x)
+    sy = height / (max_y - min_y)
+
+    def to_px(points):
+        return [((x - min_x) * sx, (max_y - y) * sy) for x, y in points]
+
+    image = Image.new('RGB', size, LAND)
+    draw = ImageDraw.Draw(image)
+
+    visible = index.query(viewport)
+    roads = [f for f in visible if f.kind == "road"]
+    routes = [f for f in visible if f.kind == "route"]
+    stops = [f for f in visible if f.kind == "stop"]
+    buses = [f for f in visible if f.kind == "bus"]
+
+    # Minor roads first so major roads sit on top
+    roads.sort(key=lambda f: ROAD_STYLES.get(f.props.get("highway"), DEFAULT_ROAD_STYLE)[0])
+    styled = [(to_px(f.points), ROAD_STYLES.get(f.props.get("highway"), DEFAULT_ROAD_STYLE))
+              for f in roads]
+    for points, (road_w, _) in styled:
+        draw.line(points, fill=ROAD_CASING, width=int((road_w + 2) * scale), joint="curve")
+    for points, (road_w, color) in styled:
+        draw.line(points, fill=color, width=int(road_w * scale), joint="curve")
+
+    for f in routes:
+        points = to_px(f.points)
+        draw.line(points, fill=(255, 255, 255), width=int(14 * scale), joint="curve")
+        draw.line(points, fill=ROUTE_COLOR, width=int(9 * scale), joint="curve")
+
+    r = 13 * scale
+    for f in stops:
+        x, y = to_px(f.points)[0]
+        draw.ellipse([x - r, y - r, x + r, y + r], fill=STOP_COLOR, outline=(255, 255, 255), width=int(4 * scale))
+
+    for f in buses:
+        x, y = to_px(f.points)[0]
+        bw, bh = 30 * scale, 20 * scale
+        draw.rounded_rectangle([x - bw, y - bh, x + bw, y + bh], radius=int(6 * scale),
+                               fill=BUS_COLOR, outline=OUTLINE, width=int(3 * scale))
+        draw.rectangle([x - bw + 8 * scale, y - bh + 6 * scale, x + bw - 8 * scale, y - 2 * scale],
+                       fill=(174, 229, 255))
+        for wx in (x - bw * 0.55, x + bw * 0.55):
+            draw.ellipse([wx - 6 * scale, y + bh - 6 * scale, wx + 6 * scale, y + bh + 6 * scale], fill=OUTLINE)
+
+    return image
+
+
+def main():
+    """Render a preview of an extract: offline_map_renderer.py EXTRACT [OUT.png]"""
+    if len(sys.argv) < 2:
+        print("Usage: python offline_map_renderer.py <extract.geojson|extract.osm> [out.png]")
+        exit(1)
+    index = load_extract(sys.argv[1])
+    output_path = sys.argv[2] if len(sys.argv) > 2 else "map_preview.png"
+    render_map(index, (1182, 800)).save(output_path)
+    print(f"✓ Rendered {len(index.features)} features to {output_path}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+BusWay Pro - Instanced Stamping
+Renders a shape or composite group once and pastes it at many positions,
+with optional per-instance tint and text slots. Used by the asset
+generators for windows, wheels, cards and calendar grids.
+"""
+
+from functools import lru_cache
+
+from PIL import Image, ImageChops, ImageDraw
+
+
+@lru_cache(maxsize=1024)
+def text_tile(text, font=None, fill=(0, 0, 0), anchor=None):
+    """
+    Render a string once onto a transparent tile.
+    Returns (tile, (dx, dy)) where (dx, dy) is the tile offset from the anchor point.
+    """
+    scratch = ImageDraw.Draw(Image.new('RGBA', (1, 1)))
+    left, top, right, bottom = scratch.textbbox((0, 0), text, font=font, anchor=anchor)
+    tile = Image.new('RGBA', (max(right - left, 1), max(bottom - top, 1)), (0, 0, 0, 0))
+    ImageDraw.Draw(tile).text((-left, -top), text, font=font, fill=fill, anchor=anchor)
+    return tile, (left, top)
+
+
+def stamp_text(canvas, xy, text, font=None, fill=(0, 0, 0), anchor=None):
+    """Draw text through the tile cache; same result as ImageDraw.text()"""
+    tile, (dx, dy) = text_tile(text, font, fill, anchor)
+    canvas.paste(tile, (int(xy[0] + dx), int(xy[1] + dy)), tile)
+
+
+def _check_length(name, values, positions):
+    """Reject a per-instance list that would silently drop or ignore instances"""
+    if values is not None and len(values) != len(positions):
+        raise ValueError(f"{len(values)} {name} given for {len(positions)} positions")
+
+
+class TextSlot:
+    """Where a per-instance string goes, relative to the stamp's origin"""
+
+    def __init__(self, offset, fill=(0, 0, 0), font=None, anchor=None):
+        self.offset = offset
+        self.fill = fill
+        self.font = font
+        self.anchor = anchor
+
+
+class Stamp:
+    """
+    A shape drawn once onto a transparent tile and pasted at each instance position.
+
+    `draw_fn` receives an ImageDraw for the tile; shapes are drawn in tile
+    coordinates with `origin` mapped to the instance position, so a shape
+    that starts left of or above its anchor point can still be stamped.
+    """
+
+    def __init__(self, size, draw_fn, origin=(0, 0), text_slots=()):
+        self.image = Image.new('RGBA', size, (0, 0, 0, 0))
+        draw_fn(ImageDraw.Draw(self.image))
+        self.origin = origin
+        self.text_slots = list(text_slots)
+        self._tinted = {None: self.image}
+
+    def tinted(self, tint):
+        """Tile multiplied by an RGB tint, alpha kept; cached per tint"""
+        tile = self._tinted.get(tint)
+        if tile is None:
+            *rgb, alpha = self.image.split()
+            rgb = ImageChops.multiply(Image.merge('RGB', rgb), Image.new('RGB', self.image.size, tint))
+            tile = Image.merge('RGBA', (*rgb.split(), alpha))
+            self._tinted[tint] = tile
+        return tile
+
+    def stamp(self, canvas, positions, tints=None, texts=None):
+        """
+        Paste the tile at every position.
+        `tints` and `texts` are optional per-instance lists; each entry of
+        `texts` holds one string (or None) per text slot.
+        Raises ValueError if either list doesn't match `positions` in length.
+        """
+        ox, oy = self.origin
+        positions = list(positions)
+        _check_length("tints", tints, positions)
+        _check_length("texts", texts, positions)
+        tints = tints or [None] * len(positions)
+
+        # One masked paste per instance, grouped so each tint variant is built once
+        groups = {}
+        for (x, y), tint in zip(positions, tints):
+            groups.setdefault(tint, []).append((x - ox, y - oy))
+        for tint, boxes in groups.items():
+            tile = self.tinted(tint)
+            for box in boxes:
+                canvas.paste(tile, box, tile)
+
+        if texts:
+            self._stamp_texts(canvas, positions, texts)
+
+    def stamp_grid(self, canvas, origin, step, count, cols, tints=None, texts=None):
+        """
+        Stamp `count` instances in a row-major grid of `cols` columns.
+        Without tints, one row is composed once and pasted per row, so the
+        cost grows with rows + cols rather than rows * cols.
+        """
+        x0, y0 = origin
+        dx, dy = step
+        positions = [(x0 + (i % cols) * dx, y0 + (i // cols) * dy) for i in range(count)]
+        _check_length("tints", tints, positions)
+        _check_length("texts", texts, positions)
+
+        if tints or count <= cols:
+            self.stamp(canvas, positions, tints=tints)
+        else:
+            width, height = self.image.size
+            row_cols = min(cols, count)
+            row = Image.new('RGBA', ((row_cols - 1) * dx + width, height), (0, 0, 0, 0))
+            for col in range(row_cols):
+                row.paste(self.image, (col * dx, 0), self.image)
+
+            ox, oy = self.origin
+            full_rows, remainder = divmod(count, cols)
+            for r in range(full_rows):
+                canvas.paste(row, (x0 - ox, y0 + r * dy - oy), row)
+            if remainder:
+                part = row.crop((0, 0, (remainder - 1) * dx + width, height))
+                canvas.paste(part, (x0 - ox, y0 + full_rows * dy - oy), part)
+
+        if texts:
+            self._stamp_texts(canvas, positions, texts)
+
+    def _stamp_texts(self, canvas, positions, texts):
+        for (x, y), strings in zip(positions, texts):
+            for slot, text in zip(self.text_slots, strings):
+                if text:
+                    stamp_text(canvas, (x + slot.offset[0], y + slot.offset[1]), text,
+                               slot.font, slot.fill, slot.anchor)